@@ -4,6 +4,7 @@ from news_api import NewsAPI
 from summarizer import ArticleSummarizer
 from elevenLabs import ElevenLabs
 from s3_cache import S3CacheManager
+from topic_index import TopicIndex
 import os
 from openai import OpenAI
 from perplexity import PerplexityAPI
@@ -40,6 +41,23 @@ news_api = NewsAPI()
 summarizer = ArticleSummarizer()
 cache_manager = S3CacheManager()
 perplexity_api = PerplexityAPI()
+topic_index = TopicIndex(ttl=cache_manager.cache_duration)
+topic_index_loaded = False
+
+def _load_topic_index():
+    """Index the explorations already cached so equivalent topics resolve to them.
+
+    Runs once per process, on the first explore request rather than at import,
+    so importing the app (or the reloader's second process) makes no S3 call.
+    After that each worker only indexes the explorations it generates itself:
+    a topic generated by another worker misses the index until this one restarts.
+    """
+    global topic_index_loaded
+    if topic_index_loaded:
+        return
+    topic_index_loaded = True
+    for cached_topic, cached_at in cache_manager.list_explorations().items():
+        topic_index.add(cached_topic, cached_topic, added_at=cached_at)
 
 @app.route('/api/news', methods=['GET'])
 def get_news():
@@ -114,20 +132,39 @@ def explore_topic():
         if not topic:
             return jsonify({'error': 'Topic is required'}), 400
         
-        # Sanitize the topic for use in filenames
+        _load_topic_index()
+        
+        # Sanitize the topic for use in filenames. A new exploration is always
+        # stored under its own topic, never under the key of a matched one
         sanitized_topic = sanitize_filename(topic)
         
-        # Check cache first
+        # Reuse the cache of an equivalent topic ("AI Chips" vs "ai chips?")
+        resolved_topic = topic_index.lookup(topic)
+        if resolved_topic and resolved_topic != sanitized_topic:
+            cached_exploration = cache_manager.get_cached_exploration(resolved_topic)
+            audio_url = cache_manager.get_audio_url(f"explore_{resolved_topic}")
+            if cached_exploration and audio_url:
+                topic_index.record_cache_result(True)
+                return jsonify({
+                    'exploration': cached_exploration,
+                    'cached': True,
+                    'audio_url': audio_url
+                })
+        
+        # Then the topic's own cache
         cached_exploration = cache_manager.get_cached_exploration(sanitized_topic)
         audio_url = cache_manager.get_audio_url(f"explore_{sanitized_topic}")
         
         if cached_exploration and audio_url:
+            topic_index.record_cache_result(True)
             return jsonify({
                 'exploration': cached_exploration,
                 'cached': True,
                 'audio_url': audio_url
             })
         
+        topic_index.record_cache_result(False)
+        
         # Use OpenAI to generate initial understanding
         openai_response = client.chat.completions.create(
             model="gpt-4",
@@ -179,6 +216,7 @@ Host B: Absolutely, Edward. The information we've discussed today shows just how
         # Cache both exploration and audi | CHANGED
         cache_manager.cache_exploration(sanitized_topic, initial_understanding)
         cache_manager.cache_audio(f"explore_{sanitized_topic}", audio_file)
+        topic_index.add(topic, sanitized_topic)
         
         # Get the new audio URL
         audio_url = cache_manager.get_audio_url(f"explore_{sanitized_topic}")
@@ -197,5 +235,9 @@ Host B: Absolutely, Edward. The information we've discussed today shows just how
         print(f"Error in explore_topic: {str(e)}")  # Add logging
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/topic-index/stats', methods=['GET'])
+def topic_index_stats():
+    return jsonify(topic_index.stats())
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000) 
\ No newline at end of file
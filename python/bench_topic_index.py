@@ -0,0 +1,107 @@
+"""Benchmark the topic index on a few thousand synthetic topics.
+
+Run with `python bench_topic_index.py`.
+"""
+import random
+import time
+
+from topic_index import TopicIndex
+
+
+def synthetic_topics(count, rng):
+    subjects = ['ai', 'quantum', 'solar', 'battery', 'crypto', 'gene', 'ocean',
+                'climate', 'robot', 'space', 'vaccine', 'chip', 'fusion', 'drone',
+                'privacy', 'satellite', 'wildfire', 'housing', 'election', 'coral']
+    objects = ['chips', 'computing', 'panels', 'storage', 'regulation', 'editing',
+               'currents', 'policy', 'surgery', 'tourism', 'research', 'exports',
+               'reactors', 'deliveries', 'laws', 'launches', 'prevention',
+               'markets', 'security', 'reefs', 'startups', 'funding', 'safety']
+    qualifiers = ['in europe', 'in china', 'for kids', 'in 2025', 'at scale',
+                  'in hospitals', 'on mars', 'in farming', 'for cities', '']
+    topics = set()
+    while len(topics) < count:
+        topic = f"{rng.choice(subjects)} {rng.choice(objects)} {rng.choice(qualifiers)}"
+        topics.add(topic.strip())
+    return sorted(topics)
+
+
+# Proper nouns that are spelled alike but are different topics
+CONFUSABLE_PAIRS = [
+    ('austria', 'australia'), ('slovakia', 'slovenia'), ('sweden', 'swede'),
+    ('iran', 'iraq'), ('niger', 'nigeria'), ('gambia', 'zambia'),
+    ('mali', 'bali'), ('chile', 'china'), ('dominica', 'dominican'),
+    ('guinea', 'guyana'), ('georgia', 'georgian'), ('latvia', 'lithuania'),
+    ('india', 'indiana'), ('paris', 'parish'), ('poland', 'portland'),
+]
+
+
+def confusable_topics():
+    """Pairs of topics that only differ by a similarly spelled proper noun."""
+    pairs = []
+    for first, second in CONFUSABLE_PAIRS:
+        for subject in ('election', 'economy', 'politics', 'travel', 'wildfires'):
+            pairs.append((f"{first} {subject}", f"{second} {subject}"))
+            pairs.append((f"{second} {subject}", f"{first} {subject}"))
+    return pairs
+
+
+def variant(topic, rng):
+    """Rephrase a topic the way different users would type it."""
+    words = topic.split()
+    choice = rng.randrange(6)
+    if choice == 0:
+        return topic.title()
+    if choice == 1:
+        return topic.upper() + '?'
+    if choice == 2:
+        return 'About the ' + topic + '!'
+    if choice == 3:
+        second = words[1]
+        if second.endswith('ies'):
+            second = second[:-3] + 'y'
+        elif second.endswith('y'):
+            second = second[:-1] + 'ies'
+        else:
+            second = second[:-1] if second.endswith('s') else second + 's'
+        return ' '.join([words[0], second] + words[2:])
+    if choice == 4:
+        # Drop one letter from the longest word
+        longest = max(words, key=len)
+        pos = rng.randrange(1, len(longest) - 1)
+        return topic.replace(longest, longest[:pos] + longest[pos + 1:], 1)
+    return topic.replace(' ', '-') + '...'
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    index = TopicIndex()
+    topics = synthetic_topics(3000, rng)
+
+    start = time.perf_counter()
+    for topic in topics:
+        index.add(topic, topic.replace(' ', '_'))
+    add_time = time.perf_counter() - start
+
+    variants = [(variant(topic, rng), topic.replace(' ', '_')) for topic in topics]
+    start = time.perf_counter()
+    correct = sum(index.lookup(variant) == key for variant, key in variants)
+    lookup_time = time.perf_counter() - start
+    print(f"Indexed {len(index)} topics in {add_time * 1000:.1f} ms")
+    print(f"Variant lookups: {len(variants)} in {lookup_time * 1000:.1f} ms "
+          f"({lookup_time / len(variants) * 1e6:.1f} us each)")
+    print(f"Resolved to the original topic: {correct / len(variants):.1%}")
+
+    unseen = TopicIndex()
+    for topic in topics[::2]:
+        unseen.add(topic, topic)
+    false_hits = sum(unseen.lookup(topic) is not None for topic in topics[1::2])
+    print(f"False matches on unseen topics: {false_hits / len(topics[1::2]):.1%}")
+
+    confusable = confusable_topics()
+    false_hits = 0
+    for indexed, query in confusable:
+        pair_index = TopicIndex()
+        pair_index.add(indexed, indexed)
+        false_hits += pair_index.lookup(query) is not None
+    print(f"False matches on confusable proper nouns: {false_hits}/{len(confusable)}")
+    print(f"Stats: {index.stats()}")
@@ -88,6 +88,22 @@ class S3CacheManager:
         except Exception as e:
             print(f"Error caching exploration: {e}")
 
+    def list_explorations(self):
+        """Return {topic: cached time} for every exploration that is still valid."""
+        explorations = {}
+        try:
+            paginator = self.s3.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix='explorations/'):
+                for obj in page.get('Contents', []):
+                    topic = obj['Key'][len('explorations/'):-len('.json')]
+                    # LastModified is in UTC; cache timestamps use local time
+                    cache_time = obj['LastModified'].astimezone().replace(tzinfo=None)
+                    if datetime.now() - cache_time <= self.cache_duration:
+                        explorations[topic] = cache_time
+        except Exception as e:
+            print(f"Error listing cached explorations: {e}")
+        return explorations
+
     def cache_audio(self, category, audio_file_path):
         try:
             audio_key = self._get_audio_key(category)
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from bench_topic_index import CONFUSABLE_PAIRS
+from topic_index import TopicIndex, canonicalize, stem
+
+
+@pytest.mark.parametrize("plural, singular", [
+    ('chips', 'chip'),
+    ('cases', 'case'),
+    ('prices', 'price'),
+    ('cities', 'city'),
+    ('taxes', 'tax'),
+    ('crashes', 'crash'),
+    ('churches', 'church'),
+    ('classes', 'class'),
+    ('movies', 'movie'),
+    ('cookies', 'cookie'),
+    ('headaches', 'headache'),
+    ('buses', 'bus'),
+    ('viruses', 'virus'),
+    ('policies', 'policy'),
+])
+def test_stem_plural_matches_singular(plural, singular):
+    assert stem(plural) == stem(singular)
+
+
+@pytest.mark.parametrize("word", ['species', 'series', 'news', 'aids', 'niger', 'virus', 'crisis', 'class'])
+def test_stem_leaves_non_plurals_alone(word):
+    assert stem(word) == word
+
+
+def test_canonicalize_ignores_case_and_punctuation():
+    assert canonicalize("AI Chips") == canonicalize("ai chips")
+    assert canonicalize("AI chips?") == canonicalize("AI_Chips")
+    assert canonicalize("COVID cases") == canonicalize("covid case")
+    assert canonicalize("About the AI chips!") == canonicalize("ai chips")
+
+
+def test_canonicalize_keeps_topic_words():
+    assert canonicalize("Fox News") != canonicalize("Fox")
+    assert canonicalize("Why AI") != canonicalize("How AI")
+    assert canonicalize("Latest AI") != canonicalize("AI")
+    assert canonicalize("IT jobs") != canonicalize("jobs")
+    assert canonicalize("The Who") != canonicalize("WHO")
+    assert canonicalize("Me Too movement") != canonicalize("Too movement")
+    assert canonicalize("AIDS research") != canonicalize("aid research")
+
+
+def test_canonicalize_keeps_word_order():
+    assert canonicalize("israel attacks iran") != canonicalize("iran attacks israel")
+    assert canonicalize("dog bites man") != canonicalize("man bites dog")
+
+
+def test_canonicalize_keeps_non_ascii_words():
+    assert canonicalize("人工智能") == "人工智能"
+    assert canonicalize("!!!") == ''
+
+
+def test_lookup_skips_topics_without_words():
+    index = TopicIndex()
+    index.add("人工智能", "人工智能")
+    index.add("!!!", "___")
+    assert len(index) == 1
+    assert index.lookup("量子计算") is None
+    assert index.lookup("???") is None
+
+
+def test_lookup_exact_match():
+    index = TopicIndex()
+    index.add("AI Chips", "AI_Chips")
+    assert index.lookup("ai chips") == "AI_Chips"
+    assert index.lookup("AI chip?") == "AI_Chips"
+    assert index.stats()['exact_matches'] == 2
+
+
+def test_lookup_near_match_on_misspelling():
+    index = TopicIndex()
+    index.add("quantum computing", "quantum_computing")
+    assert index.lookup("quantm computing") == "quantum_computing"
+    assert index.stats()['near_matches'] == 1
+
+
+@pytest.mark.parametrize("indexed, query", [
+    ("ai chips", "ai ships"),
+    ("battery storage", "battery storage in 2025"),
+    ("ai chips", "quantum chips"),
+])
+def test_lookup_rejects_different_topics(indexed, query):
+    index = TopicIndex()
+    index.add(indexed, indexed)
+    assert index.lookup(query) is None
+
+
+@pytest.mark.parametrize("first, second", CONFUSABLE_PAIRS)
+def test_lookup_rejects_confusable_proper_nouns(first, second):
+    index = TopicIndex()
+    index.add(f"{first} election", first)
+    assert index.lookup(f"{second} election") is None
+    index = TopicIndex()
+    index.add(f"{second} election", second)
+    assert index.lookup(f"{first} election") is None
+
+
+@pytest.mark.parametrize("indexed, query", [
+    ("olympic medal", "olympic metal"),
+    ("black friday", "block friday"),
+    ("spain economy", "stain economy"),
+])
+def test_lookup_rejects_real_word_substitutions(indexed, query):
+    index = TopicIndex()
+    index.add(indexed, indexed)
+    assert index.lookup(query) is None
+    index = TopicIndex()
+    index.add(query, query)
+    assert index.lookup(indexed) is None
+
+
+def test_lookup_rejects_words_already_indexed():
+    index = TopicIndex()
+    index.add("later work", "later_work")
+    index.add("latter election", "latter_election")
+    assert index.lookup("later election") is None
+
+
+def test_lookup_skips_expired_entries():
+    index = TopicIndex(ttl=timedelta(minutes=10))
+    index.add("quantum computing", "old", added_at=datetime.now() - timedelta(minutes=11))
+    index.add("ai chips", "new")
+    assert index.lookup("quantum computing") is None
+    assert index.lookup("quantm computing") is None
+    assert index.lookup("ai chips") == "new"
+    assert len(index) == 1
+
+
+def test_stats_reports_cache_hits_separately():
+    index = TopicIndex()
+    index.add("ai chips", "ai_chips")
+    index.lookup("AI Chips")
+    index.record_cache_result(False)
+    stats = index.stats()
+    assert stats['match_rate'] == 1.0
+    assert stats['cache_hit_rate'] == 0.0
@@ -0,0 +1,270 @@
+import random
+import re
+import threading
+import zlib
+from collections import Counter
+from datetime import datetime
+
+# Function words that carry no meaning for telling two topics apart.
+# Question words, pronouns and words like "news" or "latest" are kept:
+# "Fox News", "Why AI", "IT jobs" and "Me Too movement" are different
+# requests.
+STOPWORDS = {
+    'a', 'an', 'the', 'and', 'or', 'of', 'in', 'on', 'for', 'to', 'with',
+    'about', 'is', 'are', 'was', 'be', 'by', 'at', 'from', 'as', 'its',
+    'this', 'that', 'do', 'does',
+}
+
+# Stopwords are only dropped when at least this many other words remain,
+# so "The Who" does not collapse into "WHO"
+MIN_CONTENT_WORDS = 2
+
+# Words ending in "s" that are not plurals of a shorter word
+INVARIANT_WORDS = {'news', 'species', 'series', 'means', 'aids'}
+
+# Shorter words are too easy to confuse ("iran"/"iraq", "chip"/"ship")
+MIN_FUZZY_WORD_LENGTH = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def stem(word: str) -> str:
+    """Reduce a word to a stem shared by its singular and plural forms.
+
+    The plural "s" is dropped, then a final "e" and a final "y" becomes
+    "i", so "movie"/"movies" give "movi", "city"/"cities" give "citi" and
+    "church"/"churches" give "church". Stems are not always real words.
+    """
+    if word in INVARIANT_WORDS:
+        return word
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+    if len(word) > 2 and word.endswith('e'):
+        word = word[:-1]
+    if len(word) > 2 and word.endswith('y'):
+        word = word[:-1] + 'i'
+    return word
+
+
+def canonicalize(topic: str) -> str:
+    """Reduce a topic to a canonical form: lowercase, no punctuation or
+    stopwords, and stemmed. Word order is kept, so "dog bites man" and
+    "man bites dog" stay apart. Returns '' if the topic has no words."""
+    # Unicode-aware, but without "_" so sanitized cache keys split into words
+    words = re.findall(r'[^\W_]+', topic.lower())
+    content = [word for word in words if word not in STOPWORDS]
+    if len(content) >= MIN_CONTENT_WORDS:
+        words = content
+    return ' '.join(stem(word) for word in words)
+
+
+def shingles(text: str, size: int = 3) -> set:
+    """Character n-grams of the padded text."""
+    padded = f" {text} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two words."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TopicIndex:
+    """In-memory index mapping explored topics to their cache keys.
+
+    Exact matches are found on the canonical form of the topic. Anything
+    else goes through MinHash/LSH on character trigrams to find near
+    duplicates, which are confirmed with the exact Jaccard similarity and
+    must differ from the query by one misspelled word, i.e. a letter
+    dropped or added.
+
+    Entries expire after `ttl` (a timedelta) so the index never points at
+    a cached exploration that is no longer valid.
+    """
+
+    def __init__(self, ttl=None, threshold=0.6, num_perm=64, bands=16, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.ttl = ttl
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._lock = threading.Lock()
+        self._keys = {}        # canonical topic -> cache key
+        self._shingles = {}    # canonical topic -> set of shingles
+        self._band_index = {}  # canonical topic -> its bucket keys
+        self._added = {}       # canonical topic -> time it was indexed
+        self._buckets = {}     # (band, band signature) -> set of canonical topics
+        self._vocabulary = Counter()  # word -> number of indexed topics using it
+        self._stats_counts = {'lookups': 0, 'exact_matches': 0, 'near_matches': 0,
+                             'misses': 0, 'cache_hits': 0, 'cache_misses': 0}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _signature(self, shingle_set):
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingle_set]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def _band_keys(self, signature):
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def _is_misspelling(self, words, other_words):
+        """True if the query words differ from indexed ones by one misspelled word.
+
+        Only a dropped or extra letter counts, since swapping one letter
+        easily gives another real word ("medal"/"metal", "black"/"block").
+        The words must be at least five letters long and share their first
+        and last letters, which keeps apart proper nouns such as
+        "swede"/"sweden". A query word already used by an indexed topic is
+        a real word, not a typo.
+        """
+        if len(words) != len(other_words):
+            return False
+        differing = [(word, other) for word, other in zip(words, other_words) if word != other]
+        if len(differing) != 1:
+            return False
+        word, other = differing[0]
+        if abs(len(word) - len(other)) != 1 or word in self._vocabulary:
+            return False
+        if min(len(word), len(other)) < MIN_FUZZY_WORD_LENGTH:
+            return False
+        if word[0] != other[0] or word[-1] != other[-1]:
+            return False
+        return edit_distance(word, other) == 1
+
+    def _is_expired(self, canonical):
+        return self.ttl is not None and datetime.now() - self._added[canonical] > self.ttl
+
+    def _remove(self, canonical):
+        for band_key in self._band_index.pop(canonical):
+            bucket = self._buckets[band_key]
+            bucket.discard(canonical)
+            if not bucket:
+                del self._buckets[band_key]
+        self._vocabulary.subtract(canonical.split())
+        self._vocabulary += Counter()  # drop words no longer used
+        del self._keys[canonical]
+        del self._shingles[canonical]
+        del self._added[canonical]
+
+    def _find(self, canonical):
+        """Return (cache key, match type) for a canonical topic, or (None, None)."""
+        if canonical in self._keys:
+            if not self._is_expired(canonical):
+                return self._keys[canonical], 'exact'
+            self._remove(canonical)
+
+        query = shingles(canonical)
+        candidates = set()
+        for band_key in self._band_keys(self._signature(query)):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        # Topics that differ by a whole word (e.g. "battery storage" and
+        # "battery storage in 2025", or "olympic medal" and "olympic metal")
+        # are different requests, so only a single misspelled word is tolerated
+        words = canonical.split()
+        best, best_score = None, self.threshold
+        for candidate in candidates:
+            if self._is_expired(candidate):
+                self._remove(candidate)
+                continue
+            if not self._is_misspelling(words, candidate.split()):
+                continue
+            score = jaccard(query, self._shingles[candidate])
+            if score >= best_score:
+                best, best_score = candidate, score
+        if best is None:
+            return None, None
+        return self._keys[best], 'near'
+
+    def lookup(self, topic):
+        """Return the cache key of an equivalent indexed topic, or None."""
+        canonical = canonicalize(topic)
+        with self._lock:
+            if canonical:
+                key, match = self._find(canonical)
+            else:
+                # Nothing to compare on, e.g. a topic made only of punctuation
+                key, match = None, None
+            self._stats_counts['lookups'] += 1
+            if match == 'exact':
+                self._stats_counts['exact_matches'] += 1
+            elif match == 'near':
+                self._stats_counts['near_matches'] += 1
+            else:
+                self._stats_counts['misses'] += 1
+            return key
+
+    def add(self, topic, cache_key, added_at=None):
+        """Index a topic under the given cache key.
+
+        `added_at` defaults to now and should be the time the exploration
+        was cached, so the entry expires together with it.
+        """
+        canonical = canonicalize(topic)
+        if not canonical:
+            return
+        with self._lock:
+            if canonical in self._keys:
+                self._remove(canonical)
+            shingle_set = shingles(canonical)
+            band_keys = self._band_keys(self._signature(shingle_set))
+            self._keys[canonical] = cache_key
+            self._shingles[canonical] = shingle_set
+            self._band_index[canonical] = band_keys
+            self._added[canonical] = added_at or datetime.now()
+            self._vocabulary.update(canonical.split())
+            for band_key in band_keys:
+                self._buckets.setdefault(band_key, set()).add(canonical)
+
+    def record_cache_result(self, hit):
+        """Record whether a request was served from the cache."""
+        with self._lock:
+            self._stats_counts['cache_hits' if hit else 'cache_misses'] += 1
+
+    def stats(self):
+        """Index match rate and the cache hit rate actually served.
+
+        A match can still miss the cache if the exploration it points to
+        is gone, so the two rates are reported separately.
+        """
+        with self._lock:
+            counts = dict(self._stats_counts)
+            size = len(self._keys)
+        matches = counts['exact_matches'] + counts['near_matches']
+        counts['match_rate'] = matches / counts['lookups'] if counts['lookups'] else 0.0
+        requests = counts['cache_hits'] + counts['cache_misses']
+        counts['cache_hit_rate'] = counts['cache_hits'] / requests if requests else 0.0
+        counts['indexed_topics'] = size
+        return counts